@@ -5,12 +5,113 @@ Handles generating downloadable files in TXT, MD, and PDF formats.
 """
 
 import io
+import re
+from types import SimpleNamespace
 from typing import Tuple
-from reportlab.lib.pagesizes import letter
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib.units import inch
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer
-from reportlab.lib.enums import TA_LEFT, TA_JUSTIFY
+
+# Translation table escaping ReportLab markup characters in a single pass
+HTML_ESCAPE = str.maketrans({'&': '&amp;', '<': '&lt;', '>': '&gt;'})
+
+# "# " and "## " markdown header lines (title in group 1)
+MD_HEADER_RE = re.compile(r'^##? (.*)$', re.MULTILINE)
+
+# ReportLab classes, page layout and styles - loaded on the first PDF export so
+# TXT/MD downloads never pay the reportlab import cost
+_reportlab = None
+
+
+def _load_reportlab() -> SimpleNamespace:
+    """
+    Import ReportLab and build the PDF layout and styles (once per process).
+    
+    Returns:
+        Namespace with the platypus classes, page layout, styles and
+        markdown line prefixes used by generate_pdf
+    """
+    global _reportlab
+    
+    if _reportlab is None:
+        from reportlab.lib.pagesizes import letter
+        from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+        from reportlab.lib.units import inch
+        from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer
+        from reportlab.lib.enums import TA_LEFT, TA_JUSTIFY
+        
+        styles = getSampleStyleSheet()
+        
+        title_style = ParagraphStyle(
+            'CustomTitle',
+            parent=styles['Heading1'],
+            fontSize=18,
+            spaceAfter=20,
+            alignment=TA_LEFT
+        )
+        
+        heading_style = ParagraphStyle(
+            'CustomHeading',
+            parent=styles['Heading2'],
+            fontSize=14,
+            spaceBefore=15,
+            spaceAfter=10,
+            alignment=TA_LEFT
+        )
+        
+        body_style = ParagraphStyle(
+            'CustomBody',
+            parent=styles['Normal'],
+            fontSize=11,
+            leading=14,
+            alignment=TA_JUSTIFY,
+            spaceAfter=8
+        )
+        
+        bullet_style = ParagraphStyle(
+            'CustomBullet',
+            parent=styles['Normal'],
+            fontSize=11,
+            leading=14,
+            leftIndent=20,
+            spaceAfter=6
+        )
+        
+        footer_style = ParagraphStyle(
+            'Footer',
+            parent=styles['Normal'],
+            fontSize=9,
+            textColor='gray'
+        )
+        
+        _reportlab = SimpleNamespace(
+            SimpleDocTemplate=SimpleDocTemplate,
+            Paragraph=Paragraph,
+            Spacer=Spacer,
+            layout=dict(
+                pagesize=letter,
+                rightMargin=0.75 * inch,
+                leftMargin=0.75 * inch,
+                topMargin=0.75 * inch,
+                bottomMargin=0.75 * inch
+            ),
+            title_style=title_style,
+            body_style=body_style,
+            bullet_style=bullet_style,
+            footer_style=footer_style,
+            # Markdown line prefixes rendered as their own paragraph: prefix -> (style, marker)
+            line_prefixes={
+                '## ': (heading_style, ''),
+                '# ': (title_style, ''),
+                '- ': (bullet_style, '• '),
+                '* ': (bullet_style, '• '),
+            }
+        )
+    
+    return _reportlab
+
+
+def _txt_header(match: re.Match) -> str:
+    """Render a markdown header match as a blank line, uppercase title and underline."""
+    title = match.group(1)
+    return f"\n{title.upper()}\n{'=' * len(title)}"
 
 
 def generate_txt(summary: str, video_id: str = None) -> Tuple[bytes, str]:
@@ -24,25 +125,8 @@ def generate_txt(summary: str, video_id: str = None) -> Tuple[bytes, str]:
     Returns:
         Tuple of (file_bytes, filename)
     """
-    # Clean up markdown formatting for plain text
-    text = summary
-    
-    # Remove markdown headers but keep the text
-    lines = []
-    for line in text.split('\n'):
-        # Convert headers to uppercase with underline
-        if line.startswith('## '):
-            lines.append('')
-            lines.append(line[3:].upper())
-            lines.append('=' * len(line[3:]))
-        elif line.startswith('# '):
-            lines.append('')
-            lines.append(line[2:].upper())
-            lines.append('=' * len(line[2:]))
-        else:
-            lines.append(line)
-    
-    text = '\n'.join(lines)
+    # Convert "#"/"##" headers to uppercase with underline, in one regex pass
+    text = MD_HEADER_RE.sub(_txt_header, summary)
     
     # Encode to bytes
     file_bytes = text.encode('utf-8')
@@ -94,64 +178,21 @@ def generate_pdf(summary: str, video_id: str = None) -> Tuple[bytes, str]:
     Returns:
         Tuple of (file_bytes, filename)
     """
+    pdf = _load_reportlab()
+    Paragraph = pdf.Paragraph
+    
     # Create a buffer to hold the PDF
     buffer = io.BytesIO()
     
     # Create the PDF document
-    doc = SimpleDocTemplate(
-        buffer,
-        pagesize=letter,
-        rightMargin=0.75 * inch,
-        leftMargin=0.75 * inch,
-        topMargin=0.75 * inch,
-        bottomMargin=0.75 * inch
-    )
-    
-    # Get styles
-    styles = getSampleStyleSheet()
-    
-    # Custom styles
-    title_style = ParagraphStyle(
-        'CustomTitle',
-        parent=styles['Heading1'],
-        fontSize=18,
-        spaceAfter=20,
-        alignment=TA_LEFT
-    )
-    
-    heading_style = ParagraphStyle(
-        'CustomHeading',
-        parent=styles['Heading2'],
-        fontSize=14,
-        spaceBefore=15,
-        spaceAfter=10,
-        alignment=TA_LEFT
-    )
-    
-    body_style = ParagraphStyle(
-        'CustomBody',
-        parent=styles['Normal'],
-        fontSize=11,
-        leading=14,
-        alignment=TA_JUSTIFY,
-        spaceAfter=8
-    )
-    
-    bullet_style = ParagraphStyle(
-        'CustomBullet',
-        parent=styles['Normal'],
-        fontSize=11,
-        leading=14,
-        leftIndent=20,
-        spaceAfter=6
-    )
+    doc = pdf.SimpleDocTemplate(buffer, **pdf.layout)
     
     # Build the PDF content
     story = []
     
     # Add title
-    story.append(Paragraph("Video Summary", title_style))
-    story.append(Spacer(1, 10))
+    story.append(Paragraph("Video Summary", pdf.title_style))
+    story.append(pdf.Spacer(1, 10))
     
     # Process the markdown content
     lines = summary.split('\n')
@@ -163,8 +204,8 @@ def generate_pdf(summary: str, video_id: str = None) -> Tuple[bytes, str]:
             text = ' '.join(current_text).strip()
             if text:
                 # Escape special characters for ReportLab
-                text = text.replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
-                story.append(Paragraph(text, body_style))
+                text = text.translate(HTML_ESCAPE)
+                story.append(Paragraph(text, pdf.body_style))
             current_text.clear()
     
     for line in lines:
@@ -174,26 +215,19 @@ def generate_pdf(summary: str, video_id: str = None) -> Tuple[bytes, str]:
             flush_text()
             continue
         
-        # Handle headers
-        if line.startswith('## '):
-            flush_text()
-            header_text = line[3:].replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
-            story.append(Paragraph(header_text, heading_style))
-        elif line.startswith('# '):
-            flush_text()
-            header_text = line[2:].replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
-            story.append(Paragraph(header_text, title_style))
-        # Handle bullet points
-        elif line.startswith('- ') or line.startswith('* '):
+        # Handle headers and bullet points (one dict probe per prefix length)
+        prefix = line[:3] if line[:3] in pdf.line_prefixes else line[:2]
+        line_format = pdf.line_prefixes.get(prefix)
+        
+        if line_format:
             flush_text()
-            bullet_text = line[2:].replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
-            # Add bullet character
-            story.append(Paragraph(f"• {bullet_text}", bullet_style))
+            style, marker = line_format
+            story.append(Paragraph(marker + line[len(prefix):].translate(HTML_ESCAPE), style))
         # Handle numbered lists
         elif len(line) > 2 and line[0].isdigit() and line[1] in '.):':
             flush_text()
-            list_text = line.replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
-            story.append(Paragraph(list_text, bullet_style))
+            list_text = line.translate(HTML_ESCAPE)
+            story.append(Paragraph(list_text, pdf.bullet_style))
         else:
             # Regular text - accumulate
             current_text.append(line)
@@ -203,14 +237,8 @@ def generate_pdf(summary: str, video_id: str = None) -> Tuple[bytes, str]:
     
     # Add footer with video ID if provided
     if video_id:
-        story.append(Spacer(1, 20))
-        footer_style = ParagraphStyle(
-            'Footer',
-            parent=styles['Normal'],
-            fontSize=9,
-            textColor='gray'
-        )
-        story.append(Paragraph(f"Generated from YouTube video: {video_id}", footer_style))
+        story.append(pdf.Spacer(1, 20))
+        story.append(Paragraph(f"Generated from YouTube video: {video_id}", pdf.footer_style))
     
     # Build PDF
     doc.build(story)
@@ -0,0 +1,87 @@
+"""
+LLM Response Cache Module
+
+Exact-match cache for LLM completions, keyed on a hash of the request inputs.
+Uses diskcache when available so results persist across app restarts, with an
+in-process dict as fallback.
+"""
+
+import hashlib
+import threading
+import time
+from typing import Optional
+
+# Try to use diskcache for a persistent, thread-safe cache
+try:
+    import diskcache
+    HAS_DISKCACHE = True
+except ImportError:
+    HAS_DISKCACHE = False
+
+CACHE_DIR = ".cache/llm"
+CACHE_TTL = 7 * 24 * 3600  # Seconds before a cached completion expires
+FALLBACK_MAX_ENTRIES = 256  # Size bound for the in-process fallback cache
+
+if HAS_DISKCACHE:
+    _cache = diskcache.Cache(CACHE_DIR)
+else:
+    _cache = {}
+    # run_parallel stores completions from worker threads
+    _cache_lock = threading.Lock()
+
+
+def make_key(model: str, system: str, user: str, temperature: float, max_tokens: int) -> str:
+    """
+    Build a stable cache key from everything that affects the completion.
+    
+    Args:
+        model: Model name
+        system: System prompt
+        user: User message content
+        temperature: Sampling temperature
+        max_tokens: Completion token limit
+        
+    Returns:
+        SHA-256 hex digest
+    """
+    raw = f"{model}|{temperature}|{max_tokens}|{system}|{user}"
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def lookup(key: str) -> Optional[str]:
+    """Return the cached completion for key, or None on a miss or expired entry."""
+    if HAS_DISKCACHE:
+        return _cache.get(key)
+    
+    with _cache_lock:
+        entry = _cache.get(key)
+        if entry is None:
+            return None
+        
+        expires_at, content = entry
+        if time.monotonic() >= expires_at:
+            _cache.pop(key, None)
+            return None
+        
+        return content
+
+
+def store(key: str, content: str) -> None:
+    """
+    Store a completion under key for CACHE_TTL seconds.
+    
+    The dict fallback holds at most FALLBACK_MAX_ENTRIES completions, evicting
+    the oldest first.
+    """
+    if HAS_DISKCACHE:
+        _cache.set(key, content, expire=CACHE_TTL)
+        return
+    
+    with _cache_lock:
+        _cache.pop(key, None)
+        
+        if _cache and len(_cache) >= FALLBACK_MAX_ENTRIES:
+            # Dicts keep insertion order, so the first key is the oldest entry
+            _cache.pop(next(iter(_cache)), None)
+        
+        _cache[key] = (time.monotonic() + CACHE_TTL, content)
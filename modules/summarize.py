@@ -4,9 +4,18 @@ LLM Summarization Module
 Handles transcript summarization using OpenAI API with chunking support.
 """
 
+import functools
 import os
-from typing import Optional, Tuple, List
-from openai import OpenAI
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import TYPE_CHECKING, Callable, Optional, Tuple, List, Union
+
+# The openai package is imported lazily in get_openai_client to keep app startup fast
+if TYPE_CHECKING:
+    from openai import OpenAI
+
+from modules import llm_cache
 
 # Try to import streamlit for secrets (Streamlit Cloud)
 try:
@@ -23,11 +32,11 @@ except ImportError:
     pass
 
 
-def get_secret(key: str, default: str = None) -> Optional[str]:
-    """
-    Get a secret value from Streamlit secrets or environment variables.
-    Streamlit Cloud uses st.secrets, local dev uses .env
-    """
+_SECRETS = {}
+
+
+def _read_secret(key: str) -> Optional[str]:
+    """Read a secret from Streamlit secrets, falling back to the environment."""
     # Try Streamlit secrets first (for Streamlit Cloud)
     if HAS_STREAMLIT:
         try:
@@ -36,11 +45,48 @@ def get_secret(key: str, default: str = None) -> Optional[str]:
             pass
     
     # Fallback to environment variable
-    return os.getenv(key, default)
+    return os.getenv(key)
+
+
+def get_secret(key: str, default: str = None) -> Optional[str]:
+    """
+    Get a secret value from Streamlit secrets or environment variables.
+    Streamlit Cloud uses st.secrets, local dev uses .env
+    
+    Values that are found are memoized for the life of the process (restart
+    the app after changing them); missing keys are looked up again on every
+    call so a secret added later is picked up.
+    """
+    if key not in _SECRETS:
+        value = _read_secret(key)
+        if value is None:
+            return default
+        _SECRETS[key] = value
+    
+    return _SECRETS[key]
 
 # Constants
 DEFAULT_MODEL = "gpt-4o"
-MAX_CHUNK_CHARS = 12000  # Conservative limit for chunking
+MAX_CHUNK_CHARS = 12000  # Conservative limit for chunking (used when tiktoken is unavailable)
+MODEL_CONTEXT_TOKENS = {  # Context window by model-name prefix, most specific first
+    "gpt-4o": 128000,
+    "gpt-4.1": 128000,
+    "gpt-4-turbo": 128000,
+    "gpt-4": 8192,
+    "gpt-3.5-turbo": 16385,
+}
+DEFAULT_CONTEXT_TOKENS = 16000  # Assumed context window for unlisted models
+CHUNK_CONTEXT_RATIO = 0.8  # Fraction of the context window a request may fill
+COMPLETION_RESERVE_TOKENS = 3000  # Room left for the model's response
+FALLBACK_ENCODING = "o200k_base"  # tiktoken encoding for models it doesn't know
+MAX_PARALLEL_CHUNKS = 8  # Concurrent chunk requests (network-bound, one shared client)
+HTTP_MAX_CONNECTIONS = 32  # Connection pool size for the shared OpenAI client
+HTTP_MAX_KEEPALIVE = 16  # Idle connections kept open between requests
+MAX_META_SUMMARY_INPUTS = 4  # Summaries combined in one final call; more are merged pairwise first
+TEMPERATURE = 0.3
+STREAM_UPDATE_INTERVAL = 0.1  # Minimum seconds between streamed UI updates
+TRUNCATION_NOTE = "\n\n*[Truncated: the response reached the token limit.]*"  # Appended to cut-off responses
+SENTENCE_SPLIT_RE = re.compile(r'(?<=[.?!])\s+')  # Whitespace following sentence-ending punctuation
 SUMMARY_SYSTEM_PROMPT = """You are an expert analyst specializing in extracting key insights from video transcripts. 
 Your summaries are concise, well-structured, and actionable.
 
@@ -91,9 +137,40 @@ Group the main themes or arguments logically across all sections. Use subheading
 Eliminate redundancy while preserving all unique insights. Ensure the final summary reads as a cohesive whole, not as disconnected parts."""
 
 
-def get_openai_client() -> Optional[OpenAI]:
+def _create_client(api_key: str) -> "OpenAI":
+    """
+    Construct an OpenAI client for the given API key.
+    
+    Uses a pooled HTTP/2 connection (when the h2 package is installed) so the
+    parallel chunk requests are multiplexed over one TLS session.
     """
-    Initialize and return OpenAI client.
+    import httpx
+    from openai import DefaultHttpxClient, OpenAI
+    
+    try:
+        import h2  # noqa: F401 - required by httpx for HTTP/2
+        http2 = True
+    except ImportError:
+        http2 = False
+    
+    http_client = DefaultHttpxClient(
+        http2=http2,
+        limits=httpx.Limits(max_connections=HTTP_MAX_CONNECTIONS, max_keepalive_connections=HTTP_MAX_KEEPALIVE)
+    )
+    
+    return OpenAI(api_key=api_key, http_client=http_client)
+
+
+# Share one client (and its connection pool) per API key across reruns
+if HAS_STREAMLIT:
+    _create_client = st.cache_resource(show_spinner=False)(_create_client)
+else:
+    _create_client = functools.lru_cache(maxsize=None)(_create_client)
+
+
+def get_openai_client() -> Optional["OpenAI"]:
+    """
+    Return the shared OpenAI client, creating it on first use.
     
     Returns:
         OpenAI client or None if API key not configured
@@ -103,7 +180,7 @@ def get_openai_client() -> Optional[OpenAI]:
     if not api_key:
         return None
     
-    return OpenAI(api_key=api_key)
+    return _create_client(api_key)
 
 
 def get_model() -> str:
@@ -111,47 +188,229 @@ def get_model() -> str:
     return get_secret("OPENAI_MODEL", DEFAULT_MODEL)
 
 
-def chunk_text(text: str, max_chars: int = MAX_CHUNK_CHARS) -> List[str]:
+@functools.lru_cache(maxsize=None)
+def _load_encoding(model: str):
+    """
+    Load the tiktoken encoding for a model.
+    
+    Only successful loads are memoized; a failure raises, so the next call
+    tries again.
+    """
+    import tiktoken
+    
+    try:
+        return tiktoken.encoding_for_model(model)
+    except KeyError:
+        return tiktoken.get_encoding(FALLBACK_ENCODING)
+
+
+def get_encoding(model: str):
+    """
+    Get the tiktoken encoding for a model.
+    
+    Returns:
+        tiktoken Encoding, or None if tiktoken is not installed or its
+        encoding files could not be loaded
+    """
+    try:
+        return _load_encoding(model)
+    except Exception:
+        # Encoding files are downloaded on first use; fall back to character chunking
+        return None
+
+
+@functools.lru_cache(maxsize=None)
+def get_chunk_token_limit(model: str) -> int:
+    """
+    Get the maximum number of transcript tokens to send in one request.
+    
+    Fills CHUNK_CONTEXT_RATIO of the model's context window, minus the longest
+    system prompt and the completion reserve.
+    
+    Args:
+        model: Model name
+        
+    Returns:
+        Token budget per chunk (requires tiktoken)
+    """
+    encoding = get_encoding(model)
+    
+    context_tokens = next(
+        (tokens for prefix, tokens in MODEL_CONTEXT_TOKENS.items() if model.startswith(prefix)),
+        DEFAULT_CONTEXT_TOKENS
+    )
+    prompt_tokens = max(
+        len(encoding.encode(prompt)) for prompt in (SUMMARY_SYSTEM_PROMPT, CHUNK_SUMMARY_PROMPT)
+    )
+    
+    return int(context_tokens * CHUNK_CONTEXT_RATIO) - prompt_tokens - COMPLETION_RESERVE_TOKENS
+
+
+def chat_completion(
+    client: "OpenAI",
+    model: str,
+    system_prompt: str,
+    user_content: str,
+    max_tokens: int,
+    stream_callback: Optional[Callable[[str], None]] = None
+) -> str:
+    """
+    Run a chat completion, serving repeat requests from the response cache.
+    
+    When stream_callback is given the response is streamed and the callback
+    receives the accumulated text, at most every STREAM_UPDATE_INTERVAL seconds
+    plus once at the end.
+    
+    The static system prompt is always sent first and never interpolated, so
+    OpenAI's automatic prefix caching can reuse it across calls.
+    
+    Args:
+        client: OpenAI client
+        model: Model name to use
+        system_prompt: System message content
+        user_content: User message content
+        max_tokens: Completion token limit
+        stream_callback: Optional callback receiving partial text while streaming
+        
+    Returns:
+        Completion text, with TRUNCATION_NOTE appended if the response was cut
+        off at max_tokens (API errors and empty responses are raised to the
+        caller)
+    """
+    key = llm_cache.make_key(model, system_prompt, user_content, TEMPERATURE, max_tokens)
+    
+    cached = llm_cache.lookup(key)
+    if cached is not None:
+        if stream_callback:
+            stream_callback(cached)
+        return cached
+    
+    response = client.chat.completions.create(
+        model=model,
+        messages=[
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": user_content}
+        ],
+        temperature=TEMPERATURE,
+        max_tokens=max_tokens,
+        stream=stream_callback is not None
+    )
+    
+    if stream_callback:
+        buffer = []
+        finish_reason = None
+        last_update = time.monotonic()
+        pending = False
+        
+        for event in response:
+            if not event.choices:
+                continue
+            choice = event.choices[0]
+            if choice.finish_reason:
+                finish_reason = choice.finish_reason
+            delta = choice.delta.content
+            if delta:
+                buffer.append(delta)
+                pending = True
+                # Throttle UI updates rather than re-rendering on every token
+                now = time.monotonic()
+                if now - last_update >= STREAM_UPDATE_INTERVAL:
+                    stream_callback("".join(buffer))
+                    last_update = now
+                    pending = False
+        
+        content = "".join(buffer)
+        if pending:
+            stream_callback(content)
+    else:
+        content = response.choices[0].message.content
+        finish_reason = response.choices[0].finish_reason
+    
+    if not content:
+        raise RuntimeError("The model returned an empty response.")
+    
+    # Only cache complete answers; a cut-off one is still returned, with a note
+    if finish_reason == "stop":
+        llm_cache.store(key, content)
+    elif finish_reason == "length":
+        content += TRUNCATION_NOTE
+        if stream_callback:
+            stream_callback(content)
+    
+    return content
+
+
+def chunk_text(text: str, max_chars: int = MAX_CHUNK_CHARS, model: str = None) -> List[str]:
     """
     Split text into chunks, trying to break at sentence boundaries.
     
+    When a model is given and tiktoken is installed, chunks are packed by token
+    count up to get_chunk_token_limit(model), and any sentence longer than that
+    is sliced on token boundaries; otherwise chunks are packed by max_chars
+    characters.
+    
     Args:
         text: Full text to chunk
-        max_chars: Maximum characters per chunk
+        max_chars: Maximum characters per chunk (character fallback)
+        model: Optional model name for token-based chunking
         
     Returns:
         List of text chunks
     """
-    if len(text) <= max_chars:
-        return [text]
+    encoding = get_encoding(model) if model else None
+    
+    if encoding:
+        limit = get_chunk_token_limit(model)
+        if len(encoding.encode_ordinary(text)) <= limit:
+            return [text]
+    else:
+        limit = max_chars
+        if len(text) <= limit:
+            return [text]
     
     chunks = []
-    current_chunk = ""
+    current_parts = []
+    current_len = 0
     
     # Split by sentences (rough approximation)
-    sentences = text.replace("? ", "?|").replace("! ", "!|").replace(". ", ".|").split("|")
+    sentences = [s for s in (part.strip() for part in SENTENCE_SPLIT_RE.split(text)) if s]
     
-    for sentence in sentences:
-        sentence = sentence.strip()
-        if not sentence:
-            continue
-            
+    # Measure each sentence in tokens or characters
+    if encoding:
+        pieces = []
+        for sentence, tokens in zip(sentences, encoding.encode_ordinary_batch(sentences)):
+            if len(tokens) <= limit:
+                pieces.append((sentence, len(tokens)))
+                continue
+            # Unpunctuated captions can form one huge "sentence"; slice it on token boundaries
+            for start in range(0, len(tokens), limit):
+                piece = tokens[start:start + limit]
+                pieces.append((encoding.decode(piece), len(piece)))
+        # The joining space usually merges into the next token, so it costs nothing
+        separator = 0
+    else:
+        pieces = [(sentence, len(sentence)) for sentence in sentences]
+        separator = 1
+    
+    for sentence, size in pieces:
         # If adding this sentence would exceed limit
-        if len(current_chunk) + len(sentence) + 1 > max_chars:
-            if current_chunk:
-                chunks.append(current_chunk.strip())
-            current_chunk = sentence
+        if current_len + size + separator > limit:
+            if current_parts:
+                chunks.append(" ".join(current_parts))
+            current_parts = [sentence]
+            current_len = size
         else:
-            current_chunk = current_chunk + " " + sentence if current_chunk else sentence
+            current_len += size + separator if current_parts else size
+            current_parts.append(sentence)
     
     # Add the last chunk
-    if current_chunk:
-        chunks.append(current_chunk.strip())
+    if current_parts:
+        chunks.append(" ".join(current_parts))
     
     return chunks
 
 
-def summarize_chunk(client: OpenAI, chunk: str, model: str) -> Tuple[bool, str]:
+def summarize_chunk(client: "OpenAI", chunk: str, model: str) -> Tuple[bool, str]:
     """
     Summarize a single chunk of text.
     
@@ -164,23 +423,18 @@ def summarize_chunk(client: OpenAI, chunk: str, model: str) -> Tuple[bool, str]:
         Tuple of (success, summary_or_error)
     """
     try:
-        response = client.chat.completions.create(
-            model=model,
-            messages=[
-                {"role": "system", "content": CHUNK_SUMMARY_PROMPT},
-                {"role": "user", "content": chunk}
-            ],
-            temperature=0.3,
-            max_tokens=2000
-        )
-        
-        return True, response.choices[0].message.content
+        return True, chat_completion(client, model, CHUNK_SUMMARY_PROMPT, chunk, max_tokens=2000)
         
     except Exception as e:
         return False, f"Error summarizing chunk: {str(e)}"
 
 
-def create_meta_summary(client: OpenAI, chunk_summaries: List[str], model: str) -> Tuple[bool, str]:
+def create_meta_summary(
+    client: "OpenAI",
+    chunk_summaries: List[str],
+    model: str,
+    stream_callback: Optional[Callable[[str], None]] = None
+) -> Tuple[bool, str]:
     """
     Create a meta-summary from multiple chunk summaries.
     
@@ -188,6 +442,7 @@ def create_meta_summary(client: OpenAI, chunk_summaries: List[str], model: str)
         client: OpenAI client
         chunk_summaries: List of summaries from each chunk
         model: Model name to use
+        stream_callback: Optional callback receiving partial text while streaming
         
     Returns:
         Tuple of (success, final_summary_or_error)
@@ -198,23 +453,109 @@ def create_meta_summary(client: OpenAI, chunk_summaries: List[str], model: str)
     ])
     
     try:
-        response = client.chat.completions.create(
-            model=model,
-            messages=[
-                {"role": "system", "content": META_SUMMARY_PROMPT},
-                {"role": "user", "content": combined_summaries}
-            ],
-            temperature=0.3,
-            max_tokens=3000
+        return True, chat_completion(
+            client,
+            model,
+            META_SUMMARY_PROMPT,
+            combined_summaries,
+            max_tokens=3000,
+            stream_callback=stream_callback
         )
         
-        return True, response.choices[0].message.content
-        
     except Exception as e:
         return False, f"Error creating meta-summary: {str(e)}"
 
 
-def summarize_transcript(transcript: str, progress_callback=None) -> Tuple[bool, str]:
+def run_parallel(
+    task: Callable[[object], Tuple[bool, str]],
+    items: List,
+    progress_callback=None,
+    progress_label: str = "Item"
+) -> Tuple[bool, Union[List[str], str]]:
+    """
+    Run a summarization task over items concurrently, preserving input order.
+    
+    Args:
+        task: Callable returning (success, result_or_error) for one item
+        items: Inputs to process
+        progress_callback: Optional callback function for progress updates
+        progress_label: Label used in progress messages
+        
+    Returns:
+        Tuple of (success, results_in_order_or_first_error)
+    """
+    results = [None] * len(items)
+    
+    with ThreadPoolExecutor(max_workers=min(MAX_PARALLEL_CHUNKS, len(items))) as executor:
+        futures = {executor.submit(task, item): i for i, item in enumerate(items)}
+        
+        for done, future in enumerate(as_completed(futures), start=1):
+            success, result = future.result()
+            
+            if not success:
+                # Bail on first failure - don't start tasks still queued
+                for pending in futures:
+                    pending.cancel()
+                return False, result
+            
+            results[futures[future]] = result
+            
+            if progress_callback:
+                progress_callback(f"{progress_label} {done}/{len(items)} done")
+    
+    return True, results
+
+
+def reduce_summaries(
+    client: "OpenAI",
+    summaries: List[str],
+    model: str,
+    progress_callback=None,
+    stream_callback: Optional[Callable[[str], None]] = None
+) -> Tuple[bool, str]:
+    """
+    Combine section summaries into one final summary.
+    
+    While there are more than MAX_META_SUMMARY_INPUTS summaries, adjacent pairs
+    are merged in parallel (a binary-tree reduce), so every meta-summary prompt
+    stays small regardless of video length. The last level is streamed.
+    
+    Args:
+        client: OpenAI client
+        summaries: Section summaries in transcript order
+        model: Model name to use
+        progress_callback: Optional callback function for progress updates
+        stream_callback: Optional callback receiving partial final summary text
+        
+    Returns:
+        Tuple of (success, final_summary_or_error)
+    """
+    while len(summaries) > MAX_META_SUMMARY_INPUTS:
+        if progress_callback:
+            progress_callback(f"Combining {len(summaries)} section summaries...")
+        
+        pairs = [summaries[i:i + 2] for i in range(0, len(summaries), 2)]
+        
+        success, result = run_parallel(
+            # An odd summary out is carried up to the next level unchanged
+            lambda pair: create_meta_summary(client, pair, model) if len(pair) == 2 else (True, pair[0]),
+            pairs,
+            progress_callback,
+            progress_label="Merge"
+        )
+        
+        if not success:
+            return False, result
+        
+        summaries = result
+    
+    if progress_callback:
+        progress_callback("Creating final summary...")
+    
+    return create_meta_summary(client, summaries, model, stream_callback=stream_callback)
+
+
+def summarize_transcript(transcript: str, progress_callback=None, stream_callback=None) -> Tuple[bool, str]:
     """
     Summarize a transcript using the configured LLM.
     
@@ -225,6 +566,8 @@ def summarize_transcript(transcript: str, progress_callback=None) -> Tuple[bool,
     Args:
         transcript: Full transcript text
         progress_callback: Optional callback function for progress updates
+        stream_callback: Optional callback receiving the final summary text as it
+            streams in (chunk-level summaries are not streamed)
         
     Returns:
         Tuple of (success, summary_or_error)
@@ -237,8 +580,12 @@ def summarize_transcript(transcript: str, progress_callback=None) -> Tuple[bool,
     
     model = get_model()
     
-    # Check if we need to chunk
-    chunks = chunk_text(transcript)
+    # Check if we need to chunk - short transcripts always fit in one request,
+    # so skip tokenizing and sentence splitting entirely
+    if len(transcript) <= MAX_CHUNK_CHARS:
+        chunks = [transcript]
+    else:
+        chunks = chunk_text(transcript, model=model)
     
     if len(chunks) == 1:
         # Single chunk - direct summarization
@@ -246,17 +593,18 @@ def summarize_transcript(transcript: str, progress_callback=None) -> Tuple[bool,
             progress_callback("Generating summary...")
         
         try:
-            response = client.chat.completions.create(
-                model=model,
-                messages=[
-                    {"role": "system", "content": SUMMARY_SYSTEM_PROMPT},
-                    {"role": "user", "content": f"Please summarize the following transcript:\n\n{transcript}"}
-                ],
-                temperature=0.3,
-                max_tokens=3000
+            # Send the transcript as-is so the request prefix (system prompt
+            # first, then user content) stays identical for provider-side caching
+            summary = chat_completion(
+                client,
+                model,
+                SUMMARY_SYSTEM_PROMPT,
+                transcript,
+                max_tokens=3000,
+                stream_callback=stream_callback
             )
             
-            return True, response.choices[0].message.content
+            return True, summary
             
         except Exception as e:
             error_msg = str(e)
@@ -269,25 +617,21 @@ def summarize_transcript(transcript: str, progress_callback=None) -> Tuple[bool,
             return False, f"Error calling LLM API: {error_msg}"
     
     else:
-        # Multiple chunks - summarize each, then meta-summarize
-        chunk_summaries = []
+        # Multiple chunks - summarize each concurrently, then meta-summarize
+        if progress_callback:
+            progress_callback(f"Summarizing {len(chunks)} sections...")
         
-        for i, chunk in enumerate(chunks):
-            if progress_callback:
-                progress_callback(f"Summarizing section {i+1} of {len(chunks)}...")
-            
-            success, result = summarize_chunk(client, chunk, model)
-            
-            if not success:
-                return False, result
-            
-            chunk_summaries.append(result)
+        success, result = run_parallel(
+            lambda chunk: summarize_chunk(client, chunk, model),
+            chunks,
+            progress_callback,
+            progress_label="Section"
+        )
         
-        # Create meta-summary
-        if progress_callback:
-            progress_callback("Creating final summary...")
+        if not success:
+            return False, result
         
-        return create_meta_summary(client, chunk_summaries, model)
+        return reduce_summaries(client, result, model, progress_callback, stream_callback)
 
 
 def check_api_configuration() -> Tuple[bool, str]:
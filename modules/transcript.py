@@ -5,33 +5,145 @@ Handles fetching transcripts from YouTube videos using youtube-transcript-api v1
 Uses the modern API with FetchedTranscript objects.
 """
 
+import asyncio
+import functools
+import io
+import random
 import re
+import string
+import threading
 import time
-from typing import Optional, Tuple
-from youtube_transcript_api import YouTubeTranscriptApi
-
-# Import exceptions for error handling
-try:
-    from youtube_transcript_api._errors import (
-        TranscriptsDisabled,
-        NoTranscriptFound,
-        VideoUnavailable,
-        NoTranscriptAvailable,
-    )
-except ImportError:
-    try:
-        from youtube_transcript_api import (
-            TranscriptsDisabled,
-            NoTranscriptFound,
-            VideoUnavailable,
-            NoTranscriptAvailable,
-        )
-    except ImportError:
-        # Fallback: define as generic exceptions
-        TranscriptsDisabled = Exception
-        NoTranscriptFound = Exception
-        VideoUnavailable = Exception
-        NoTranscriptAvailable = Exception
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Tuple
+
+
+class _NotRaised(Exception):
+    """Placeholder for exception classes not (yet) imported; never raised."""
+
+
+# youtube_transcript_api (and requests) are imported on the first fetch, see
+# _get_ytt_api, so URL validation doesn't pay for them. Until then these
+# exception names are placeholders that match nothing.
+TranscriptsDisabled = _NotRaised
+NoTranscriptFound = _NotRaised
+VideoUnavailable = _NotRaised
+NoTranscriptAvailable = _NotRaised
+
+# Any supported URL form, used when the string-search fast path doesn't apply:
+# youtube.com/watch?v=, youtube.com/embed/, youtube.com/v/ (group 1) or youtu.be/ (group 2)
+VIDEO_ID_RE = re.compile(
+    r'youtube\.com/(?:watch\?(?:.+&)?v=|embed/|v/)([a-zA-Z0-9_-]{11})'
+    r'|youtu\.be/([a-zA-Z0-9_-]{11})'
+)
+
+# Characters allowed in an 11-character video ID
+VIDEO_ID_CHARS = frozenset(string.ascii_letters + string.digits + '_-')
+
+# youtube.com / youtu.be anywhere in a URL, any case
+YOUTUBE_DOMAIN_RE = re.compile(r'youtube\.com|youtu\.be', re.IGNORECASE)
+
+# Runs of whitespace, collapsed to a single space in transcript text
+WHITESPACE_RE = re.compile(r'\s+')
+
+# Any whitespace other than a lone space (what WHITESPACE_RE would change)
+IRREGULAR_WHITESPACE_RE = re.compile(r'\s{2,}|[^\S ]')
+
+# Snippet count above which transcript text is assembled in a StringIO
+STREAMED_ASSEMBLY_MIN_SNIPPETS = 1000
+
+# API instance shared by every fetch, created by _get_ytt_api
+_YTT_API = None
+_YTT_API_LOCK = threading.Lock()  # get_transcripts may create it from several threads
+
+# Upper bound on a single retry wait, in seconds
+MAX_RETRY_DELAY = 10.0
+
+# Failure messages for states that rarely change, so they are cached briefly
+VIDEO_UNAVAILABLE_MESSAGE = "This video is unavailable (private, deleted, or region-restricted)."
+TRANSCRIPTS_DISABLED_MESSAGE = "Transcripts are disabled for this video."
+NO_TRANSCRIPT_MESSAGE = "No transcript available for this video."
+
+# In-process cache of fetch results: key -> (expires_at, result). Successes and
+# "no transcript" failures are keyed on (video_id, languages); unavailable
+# videos on (video_id,) since the language doesn't matter for them
+TRANSCRIPT_CACHE_TTL = 3600  # Seconds; transcripts rarely change once published
+NEGATIVE_CACHE_TTL = 300  # Seconds; a video may be restored or get captions later
+TRANSCRIPT_CACHE_MAX_ENTRIES = 256
+_TRANSCRIPT_CACHE = {}
+_TRANSCRIPT_CACHE_LOCK = threading.Lock()  # Guards reads, evictions and writes across threads
+
+
+def _get_ytt_api():
+    """
+    Import youtube_transcript_api and create the shared API instance on first use.
+    
+    The instance uses one keep-alive requests session, so repeat and parallel
+    fetches reuse pooled TCP/TLS connections to YouTube. Also binds the
+    library's exception classes to this module's names.
+    
+    Returns:
+        YouTubeTranscriptApi instance
+    """
+    global _YTT_API, TranscriptsDisabled, NoTranscriptFound, VideoUnavailable, NoTranscriptAvailable
+    
+    if _YTT_API is not None:
+        return _YTT_API
+    
+    with _YTT_API_LOCK:
+        # Another thread may have created it while we waited for the lock
+        if _YTT_API is not None:
+            return _YTT_API
+        
+        import requests
+        from requests.adapters import HTTPAdapter
+        import youtube_transcript_api
+        
+        # Exceptions missing from the installed library version (e.g.
+        # NoTranscriptAvailable in v1.x) keep a placeholder that never matches
+        TranscriptsDisabled = getattr(youtube_transcript_api, 'TranscriptsDisabled', _NotRaised)
+        NoTranscriptFound = getattr(youtube_transcript_api, 'NoTranscriptFound', _NotRaised)
+        VideoUnavailable = getattr(youtube_transcript_api, 'VideoUnavailable', _NotRaised)
+        NoTranscriptAvailable = getattr(youtube_transcript_api, 'NoTranscriptAvailable', _NotRaised)
+        
+        session = requests.Session()
+        session.mount('https://', HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=0))
+        
+        _YTT_API = youtube_transcript_api.YouTubeTranscriptApi(http_client=session)
+    
+    return _YTT_API
+
+
+def _get_cached_transcript(key: tuple) -> Optional[Tuple[bool, str, Optional[str]]]:
+    """Return a cached fetch result, or None if missing or expired."""
+    with _TRANSCRIPT_CACHE_LOCK:
+        entry = _TRANSCRIPT_CACHE.get(key)
+        
+        if entry is None:
+            return None
+        
+        expires_at, result = entry
+        if time.monotonic() >= expires_at:
+            _TRANSCRIPT_CACHE.pop(key, None)
+            return None
+        
+        return result
+
+
+def _cache_transcript(key: tuple, result: Tuple[bool, str, Optional[str]], ttl: float) -> None:
+    """Store a fetch result for ttl seconds, evicting the oldest entry when the cache is full."""
+    with _TRANSCRIPT_CACHE_LOCK:
+        _TRANSCRIPT_CACHE.pop(key, None)
+        
+        if _TRANSCRIPT_CACHE and len(_TRANSCRIPT_CACHE) >= TRANSCRIPT_CACHE_MAX_ENTRIES:
+            # Dicts keep insertion order, so the first key is the oldest entry
+            _TRANSCRIPT_CACHE.pop(next(iter(_TRANSCRIPT_CACHE)), None)
+        
+        _TRANSCRIPT_CACHE[key] = (time.monotonic() + ttl, result)
+
+
+def _is_video_id(candidate: str) -> bool:
+    """Check that a string is exactly 11 valid video ID characters."""
+    return len(candidate) == 11 and VIDEO_ID_CHARS.issuperset(candidate)
 
 
 def extract_video_id(url: str) -> Optional[str]:
@@ -55,22 +167,30 @@ def extract_video_id(url: str) -> Optional[str]:
     
     url = url.strip()
     
-    # Pattern for standard youtube.com/watch?v= URLs
-    standard_pattern = r'(?:youtube\.com\/watch\?v=|youtube\.com\/watch\?.+&v=)([a-zA-Z0-9_-]{11})'
+    # Fast path: youtu.be/ID and youtube.com/watch?...v=ID via plain string search
+    candidate = None
     
-    # Pattern for youtu.be short URLs
-    short_pattern = r'youtu\.be\/([a-zA-Z0-9_-]{11})'
+    short_index = url.find('youtu.be/')
+    if short_index != -1:
+        candidate = url[short_index + 9:short_index + 20]
+    else:
+        watch_index = url.find('youtube.com/watch?')
+        if watch_index != -1:
+            query_start = watch_index + 18
+            if url.startswith('v=', query_start):
+                candidate = url[query_start + 2:query_start + 13]
+            else:
+                v_index = url.find('&v=', query_start)
+                if v_index != -1:
+                    candidate = url[v_index + 3:v_index + 14]
     
-    # Pattern for embed URLs
-    embed_pattern = r'youtube\.com\/embed\/([a-zA-Z0-9_-]{11})'
+    if candidate and _is_video_id(candidate):
+        return candidate
     
-    # Pattern for /v/ URLs
-    v_pattern = r'youtube\.com\/v\/([a-zA-Z0-9_-]{11})'
-    
-    for pattern in [standard_pattern, short_pattern, embed_pattern, v_pattern]:
-        match = re.search(pattern, url)
-        if match:
-            return match.group(1)
+    # Everything else (embed, /v/, unusual query layouts): one combined regex
+    match = VIDEO_ID_RE.search(url)
+    if match:
+        return match.group(1) or match.group(2)
     
     return None
 
@@ -91,7 +211,7 @@ def validate_youtube_url(url: str) -> Tuple[bool, str, Optional[str]]:
     url = url.strip()
     
     # Check if it looks like a YouTube URL
-    if not any(domain in url.lower() for domain in ['youtube.com', 'youtu.be']):
+    if not YOUTUBE_DOMAIN_RE.search(url):
         return False, "This doesn't appear to be a YouTube URL.", None
     
     video_id = extract_video_id(url)
@@ -102,6 +222,41 @@ def validate_youtube_url(url: str) -> Tuple[bool, str, Optional[str]]:
     return True, "Valid YouTube URL.", video_id
 
 
+def _assemble_text(fetched_transcript) -> str:
+    """
+    Join transcript snippets into one whitespace-normalized string.
+    
+    Long transcripts (more than STREAMED_ASSEMBLY_MIN_SNIPPETS snippets) are
+    written into a StringIO with whitespace normalized per snippet, so the
+    full text is never copied a second time by the regex cleanup.
+    
+    Args:
+        fetched_transcript: Sized iterable of snippets with a .text attribute
+        
+    Returns:
+        Transcript text with single spaces between words
+    """
+    if len(fetched_transcript) > STREAMED_ASSEMBLY_MIN_SNIPPETS:
+        buffer = io.StringIO()
+        for snippet in fetched_transcript:
+            # str.split() drops the same whitespace runs as WHITESPACE_RE
+            words = snippet.text.split()
+            if words:
+                if buffer.tell():
+                    buffer.write(' ')
+                buffer.write(' '.join(words))
+        return buffer.getvalue()
+    
+    parts = (snippet.text.strip() for snippet in fetched_transcript)
+    full_text = " ".join(part for part in parts if part)
+    
+    # Snippets are usually clean already; only collapse inner whitespace when needed
+    if IRREGULAR_WHITESPACE_RE.search(full_text):
+        full_text = WHITESPACE_RE.sub(' ', full_text)
+    
+    return full_text
+
+
 def fetch_transcript(video_id: str, languages: list = None, max_retries: int = 3) -> Tuple[bool, str, Optional[str]]:
     """
     Fetch the transcript for a YouTube video using the modern API (v1.2.3+).
@@ -117,115 +272,143 @@ def fetch_transcript(video_id: str, languages: list = None, max_retries: int = 3
     if languages is None:
         languages = ['en', 'en-US', 'en-GB']
     
-    # Create API instance
-    ytt_api = YouTubeTranscriptApi()
+    # Serve repeat requests for the same video from the in-process cache
+    video_key = (video_id,)
+    cache_key = (video_id, tuple(languages))
+    cached = _get_cached_transcript(video_key) or _get_cached_transcript(cache_key)
+    if cached is not None:
+        return cached
     
-    last_error = None
+    success, message, transcript, cacheable = _fetch_transcript(video_id, languages, max_retries)
+    result = (success, message, transcript)
+    
+    if success:
+        _cache_transcript(cache_key, result, TRANSCRIPT_CACHE_TTL)
+    elif cacheable and message == VIDEO_UNAVAILABLE_MESSAGE:
+        _cache_transcript(video_key, result, NEGATIVE_CACHE_TTL)
+    elif cacheable:
+        _cache_transcript(cache_key, result, NEGATIVE_CACHE_TTL)
+    
+    return result
+
+
+def _retry_delay(attempt: int) -> float:
+    """
+    Exponential backoff with jitter for retry number attempt (0-based).
+    
+    The random factor keeps parallel fetches from retrying in lockstep; the
+    cap bounds the worst-case wait.
+    """
+    return min((2 ** attempt) * (0.5 + random.random()), MAX_RETRY_DELAY)
+
+
+def _is_xml_error(error: Exception) -> bool:
+    """Check for the transient empty/invalid XML responses YouTube sometimes returns."""
+    error_str = str(error).lower()
+    return "no element found" in error_str or "xml" in error_str
+
+
+def _find_fallback_transcript(ytt_api, video_id: str, languages: list):
+    """
+    Find a transcript when none exists in the preferred languages.
+    
+    Lists the available transcripts and takes a preferred-language match if
+    there is one, otherwise the first available transcript (translated to
+    English when possible).
+    
+    Returns:
+        Transcript object, or None if the video has no transcripts
+    """
+    transcript_list = ytt_api.list(video_id)
+    
+    # Try to find a transcript in preferred languages
+    try:
+        return transcript_list.find_transcript(languages)
+    except NoTranscriptFound:
+        pass
     
-    for attempt in range(max_retries):
+    # Otherwise get the first available transcript
+    transcript = next(iter(transcript_list), None)
+    
+    # Try to translate to English if it's not in a preferred language
+    if transcript is not None and transcript.language_code not in languages and transcript.is_translatable:
         try:
-            # Try direct fetch first (simplest method)
-            try:
-                fetched_transcript = ytt_api.fetch(video_id, languages=languages)
-                
-                # Extract text from snippets
-                full_text = " ".join([snippet.text for snippet in fetched_transcript])
-                
-                # Clean up the text (remove multiple spaces, normalize)
-                full_text = re.sub(r'\s+', ' ', full_text).strip()
-                
-                return True, f"Transcript fetched successfully ({len(full_text):,} characters).", full_text
-                
-            except NoTranscriptFound:
-                # If direct fetch fails, try listing available transcripts
-                pass
-            except Exception as e:
-                error_str = str(e).lower()
-                if "no element found" in error_str or "xml" in error_str:
-                    if attempt < max_retries - 1:
-                        time.sleep(2 ** attempt)  # Exponential backoff
-                        continue
-                    return False, "YouTube returned an invalid response. Please try again in a few moments.", None
-                raise
+            transcript = transcript.translate('en')
+        except Exception:
+            # Use original if translation fails
+            pass
+    
+    return transcript
+
+
+def _attempt_fetch(ytt_api, video_id: str, languages: list) -> Tuple[bool, str, Optional[str], bool]:
+    """
+    Make a single fetch attempt.
+    
+    Returns:
+        Tuple of (success, message_or_error, transcript_text, cacheable) on
+        success or a definitive failure; errors worth retrying are raised.
+        cacheable is True only for failures YouTube reported explicitly
+        (unavailable video, disabled or missing transcripts).
+    """
+    try:
+        # Try direct fetch first (simplest method)
+        try:
+            fetched_transcript = ytt_api.fetch(video_id, languages=languages)
+        except NoTranscriptFound:
+            # Fallback: list available transcripts and pick one
+            transcript = _find_fallback_transcript(ytt_api, video_id, languages)
             
-            # Fallback: List available transcripts and find one
-            try:
-                transcript_list = ytt_api.list(video_id)
-                
-                transcript = None
-                
-                # Try to find a transcript in preferred languages
-                try:
-                    transcript = transcript_list.find_transcript(languages)
-                except NoTranscriptFound:
-                    pass
-                
-                # If no transcript in preferred languages, get any available and translate
-                if transcript is None:
-                    available = list(transcript_list)
-                    if available:
-                        # Get the first available transcript
-                        transcript = available[0]
-                        # Try to translate to English if it's not in English
-                        if transcript.language_code not in languages and transcript.is_translatable:
-                            try:
-                                transcript = transcript.translate('en')
-                            except Exception:
-                                # Use original if translation fails
-                                pass
-                
-                if transcript is None:
-                    return False, "No transcript available for this video.", None
-                
-                # Fetch the transcript data
-                fetched_transcript = transcript.fetch()
-                
-                # Extract text from snippets
-                full_text = " ".join([snippet.text for snippet in fetched_transcript])
-                
-                # Clean up the text
-                full_text = re.sub(r'\s+', ' ', full_text).strip()
-                
-                return True, f"Transcript fetched successfully ({len(full_text):,} characters).", full_text
-                
-            except Exception as e:
-                error_str = str(e).lower()
-                if "no element found" in error_str or "xml" in error_str:
-                    if attempt < max_retries - 1:
-                        time.sleep(2 ** attempt)
-                        continue
-                    return False, "YouTube returned an invalid response. Please try again in a few moments.", None
-                raise
+            if transcript is None:
+                return False, NO_TRANSCRIPT_MESSAGE, None, True
             
-        except TranscriptsDisabled:
-            return False, "Transcripts are disabled for this video.", None
-        except VideoUnavailable:
-            return False, "This video is unavailable (private, deleted, or region-restricted).", None
-        except NoTranscriptAvailable:
-            return False, "No transcript available for this video.", None
+            fetched_transcript = transcript.fetch()
+    except TranscriptsDisabled:
+        return False, TRANSCRIPTS_DISABLED_MESSAGE, None, True
+    except VideoUnavailable:
+        return False, VIDEO_UNAVAILABLE_MESSAGE, None, True
+    except NoTranscriptAvailable:
+        return False, NO_TRANSCRIPT_MESSAGE, None, True
+    except Exception as e:
+        # Check for other known errors (XML errors are always retried). This is
+        # only a guess from the message text, so the result is not cached
+        if not _is_xml_error(e) and "unavailable" in str(e).lower():
+            return False, VIDEO_UNAVAILABLE_MESSAGE, None, False
+        raise
+    
+    full_text = _assemble_text(fetched_transcript)
+    
+    return True, f"Transcript fetched successfully ({len(full_text):,} characters).", full_text, True
+
+
+def _fetch_transcript(video_id: str, languages: list, max_retries: int) -> Tuple[bool, str, Optional[str], bool]:
+    """
+    Fetch a transcript from YouTube, bypassing the cache (see fetch_transcript).
+    
+    Returns the _attempt_fetch tuple, including its cacheable flag.
+    """
+    ytt_api = _get_ytt_api()
+    
+    # First attempt - no retry bookkeeping on the common success path
+    try:
+        return _attempt_fetch(ytt_api, video_id, languages)
+    except Exception as e:
+        last_error = e
+    
+    for attempt in range(1, max_retries):
+        # Back off before retrying invalid XML responses
+        if _is_xml_error(last_error):
+            time.sleep(_retry_delay(attempt - 1))
+        
+        try:
+            return _attempt_fetch(ytt_api, video_id, languages)
         except Exception as e:
-            error_msg = str(e)
-            last_error = error_msg
-            
-            # Check for XML parsing errors
-            if "no element found" in error_msg.lower() or "xml" in error_msg.lower():
-                if attempt < max_retries - 1:
-                    # Wait before retrying (exponential backoff)
-                    time.sleep(2 ** attempt)
-                    continue
-                else:
-                    return False, "YouTube returned an invalid response. This may be temporary - please try again in a few moments.", None
-            
-            # Check for other known errors
-            if "Video unavailable" in error_msg or "unavailable" in error_msg.lower():
-                return False, "This video is unavailable (private, deleted, or region-restricted).", None
-            
-            # If it's the last attempt, return the error
-            if attempt == max_retries - 1:
-                return False, f"Error fetching transcript: {error_msg}", None
+            last_error = e
+    
+    if _is_xml_error(last_error):
+        return False, "YouTube returned an invalid response. This may be temporary - please try again in a few moments.", None, False
     
-    # If we get here, all retries failed
-    return False, f"Failed to fetch transcript after {max_retries} attempts. Last error: {last_error}", None
+    return False, f"Error fetching transcript: {str(last_error)}", None, False
 
 
 def get_transcript(url: str) -> Tuple[bool, str, Optional[str], Optional[str]]:
@@ -248,3 +431,80 @@ def get_transcript(url: str) -> Tuple[bool, str, Optional[str], Optional[str]]:
     success, message, transcript = fetch_transcript(video_id)
     
     return success, message, transcript, video_id
+
+
+async def fetch_transcript_async(video_id: str, languages: list = None, max_retries: int = 3) -> Tuple[bool, str, Optional[str]]:
+    """
+    Async wrapper around fetch_transcript.
+    
+    The blocking fetch runs in the event loop's default thread pool.
+    
+    Args:
+        video_id: YouTube video ID
+        languages: List of language codes to try (default: ['en', 'en-US', 'en-GB'])
+        max_retries: Maximum number of retry attempts
+        
+    Returns:
+        Tuple of (success, message_or_error, transcript_text)
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        None, functools.partial(fetch_transcript, video_id, languages, max_retries)
+    )
+
+
+async def get_transcripts_batch(urls: List[str], concurrency: int = 5) -> List[Tuple[bool, str, Optional[str], Optional[str]]]:
+    """
+    Get transcripts for several YouTube URLs concurrently.
+    
+    An unexpected error for one URL is reported in its result instead of
+    aborting the batch.
+    
+    Args:
+        urls: YouTube URLs
+        concurrency: Maximum number of fetches in flight at once
+        
+    Returns:
+        List of get_transcript results, in the same order as urls
+    """
+    loop = asyncio.get_running_loop()
+    semaphore = asyncio.Semaphore(concurrency)
+    
+    async def fetch_one(url: str):
+        async with semaphore:
+            try:
+                return await loop.run_in_executor(None, get_transcript, url)
+            except Exception as e:
+                return False, f"Error fetching transcript: {str(e)}", None, None
+    
+    return list(await asyncio.gather(*(fetch_one(url) for url in urls)))
+
+
+def get_transcripts(urls: List[str], max_workers: int = 10) -> List[Tuple[bool, str, Optional[str], Optional[str]]]:
+    """
+    Get transcripts for several YouTube URLs using a thread pool (blocking).
+    
+    Safe to call from code that already runs an event loop. An unexpected
+    error for one URL is reported in its result instead of aborting the batch.
+    
+    Args:
+        urls: YouTube URLs
+        max_workers: Maximum number of concurrent fetches
+        
+    Returns:
+        List of get_transcript results, in the same order as urls
+    """
+    if not urls:
+        return []
+    
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(urls))) as executor:
+        futures = [executor.submit(get_transcript, url) for url in urls]
+    
+    results = []
+    for future in futures:
+        try:
+            results.append(future.result())
+        except Exception as e:
+            results.append((False, f"Error fetching transcript: {str(e)}", None, None))
+    
+    return results